@@ -3,23 +3,213 @@
 Предоставляет функции для получения данных о компаниях и их вакансиях.
 """
 
-import requests
+import asyncio
+import logging
+import random
+import sqlite3
 import time
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Каталог локального кэша ответов API
+CACHE_DIR = Path.home() / ".cache" / "hh_parser"
+# Метаданные работодателя меняются редко — храним неделю
+EMPLOYER_CACHE_TTL = 7 * 24 * 3600
+# Детали вакансии обновляются чаще — храним час
+VACANCY_CACHE_TTL = 3600
+
+
+class ResponseCache:
+    """
+    Локальный кэш ответов API с TTL.
+    Горячие записи держатся в памяти процесса,
+    между запусками кэш живет в SQLite.
+    """
+
+    def __init__(self, path: Path = CACHE_DIR / "employers.db") -> None:
+        """
+        Открывает (или создает) SQLite-файл кэша.
+
+        Args:
+            path (Path): Путь к файлу кэша
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                json TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._memory: Dict[str, tuple] = {}
+
+    def get(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает закэшированный ответ, если он не старше ttl.
+
+        Args:
+            key (str): Ключ записи (например, "employer:3529")
+            ttl (float): Максимальный возраст записи в секундах
+
+        Returns:
+            Optional[Dict[str, Any]]: Данные из кэша или None
+        """
+        entry = self._memory.get(key)
+        if entry is not None and time.time() - entry[1] < ttl:
+            return entry[0]
+
+        row = self._conn.execute(
+            "SELECT json, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None and time.time() - row[1] < ttl:
+            data = orjson.loads(row[0])
+            self._memory[key] = (data, row[1])
+            return data
+
+        return None
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Сохраняет ответ в память и в SQLite.
+
+        Args:
+            key (str): Ключ записи
+            data (Dict[str, Any]): JSON-ответ API
+        """
+        now = time.time()
+        self._memory[key] = (data, now)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, json, fetched_at) "
+            "VALUES (?, ?, ?)",
+            (key, orjson.dumps(data).decode(), now),
+        )
+        self._conn.commit()
+
 
 class HeadHunterAPI:
     """
     Класс для взаимодействия с API hh.ru.
     Позволяет получать данные о компаниях и их вакансиях.
+    Используется как асинхронный контекстный менеджер:
+    все запросы выполняются через общий httpx.AsyncClient.
     """
 
     BASE_URL = "https://api.hh.ru"
     HEADERS = {"User-Agent": "JobParser/1.0"}
+    # hh.ru возвращает bad_request при частоте выше ~9 запросов в секунду
+    REQUESTS_PER_SECOND = 9
+    MAX_RETRIES = 5
+    TIMEOUT = 5
+    # Один TLS-коннект с HTTP/2-мультиплексированием обслуживает
+    # все параллельные запросы; keep-alive исключает повторные handshake
+    LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+    def __init__(self) -> None:
+        """Инициализирует API-клиент (соединение открывается в __aenter__)."""
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem = asyncio.Semaphore(self.REQUESTS_PER_SECOND)
+        self._cache = ResponseCache()
+
+    async def __aenter__(self) -> "HeadHunterAPI":
+        """Открывает общий HTTP-клиент с поддержкой HTTP/2 и keep-alive."""
+        self._client = httpx.AsyncClient(
+            headers=self.HEADERS,
+            timeout=self.TIMEOUT,
+            http2=True,
+            limits=self.LIMITS,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Закрывает HTTP-клиент."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     @staticmethod
-    def get_employer_vacancies(
-        employer_id: int, page: int = 0, per_page: int = 100
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Вычисляет паузу перед повторной попыткой запроса.
+
+        Args:
+            response (httpx.Response): Ответ сервера с ошибкой
+            attempt (int): Номер попытки (начиная с 0)
+
+        Returns:
+            float: Пауза в секундах (Retry-After или экспоненциальный backoff)
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return 2**attempt + random.random()
+
+    async def _aget(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Выполняет GET-запрос через общий клиент и возвращает JSON-ответ.
+        Частота запросов ограничена семафором (не более 9 запросов в секунду);
+        при ошибках 429/5xx и сетевых сбоях запрос повторяется
+        с экспоненциальным backoff.
+
+        Args:
+            url (str): Полный URL запроса
+            params (Optional[Dict[str, Any]]): Query-параметры запроса
+
+        Returns:
+            Dict[str, Any]: JSON-ответ API
+
+        Raises:
+            httpx.HTTPError: При неповторяемой ошибке или исчерпании попыток
+        """
+        last_error: Optional[httpx.HTTPError] = None
+
+        for attempt in range(self.MAX_RETRIES):
+            async with self._sem:
+                try:
+                    response = await self._client.get(url, params=params)
+                    response.raise_for_status()
+                    # orjson разбирает JSON в разы быстрее стандартного модуля
+                    return orjson.loads(response.content)
+                except httpx.HTTPStatusError as e:
+                    status = e.response.status_code
+                    if status != 429 and status < 500:
+                        raise
+                    last_error = e
+                    delay = self._retry_delay(e.response, attempt)
+                except orjson.JSONDecodeError as e:
+                    # Оборванный/битый ответ повторяем как сетевой сбой;
+                    # наружу уходит httpx-тип, который ловят вызывающие
+                    last_error = httpx.DecodingError(
+                        str(e), request=response.request
+                    )
+                    delay = 2**attempt + random.random()
+                except httpx.HTTPError as e:
+                    last_error = e
+                    delay = 2**attempt + random.random()
+                finally:
+                    # Каждый из 9 слотов семафора занят не меньше полной
+                    # секунды с момента запроса: в любом скользящем окне
+                    # в одну секунду стартует не более 9 запросов
+                    await asyncio.sleep(1.0)
+
+            await asyncio.sleep(delay)
+
+        raise last_error
+
+    async def get_employer_vacancies(
+        self, employer_id: int, page: int = 0, per_page: int = 100
     ) -> Optional[Dict[str, Any]]:
         """
         Получает список вакансий для указанного работодателя.
@@ -32,21 +222,20 @@ class HeadHunterAPI:
         Returns:
             Optional[Dict[str, Any]]: JSON-ответ API или None в случае ошибки
         """
-        url = f"{HeadHunterAPI.BASE_URL}/vacancies"
+        url = f"{self.BASE_URL}/vacancies"
         params = {"employer_id": employer_id, "page": page, "per_page": per_page}
 
         try:
-            response = requests.get(
-                url, params=params, headers=HeadHunterAPI.HEADERS, timeout=5
+            return await self._aget(url, params=params)
+        except httpx.HTTPError:
+            logger.warning(
+                "Ошибка при запросе вакансий для работодателя %s",
+                employer_id,
+                exc_info=True,
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Ошибка при запросе вакансий для работодателя {employer_id}: {e}")
             return None
 
-    @staticmethod
-    def get_employer_info(employer_id: int) -> Optional[Dict[str, Any]]:
+    async def get_employer_info(self, employer_id: int) -> Optional[Dict[str, Any]]:
         """
         Получает информацию о работодателе.
 
@@ -56,39 +245,66 @@ class HeadHunterAPI:
         Returns:
             Optional[Dict[str, Any]]: Информация о работодателе или None в случае ошибки
         """
-        url = f"{HeadHunterAPI.BASE_URL}/employers/{employer_id}"
+        cache_key = f"employer:{employer_id}"
+        cached = self._cache.get(cache_key, EMPLOYER_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        url = f"{self.BASE_URL}/employers/{employer_id}"
 
         try:
-            response = requests.get(url, headers=HeadHunterAPI.HEADERS, timeout=5)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Ошибка при запросе информации о работодателе {employer_id}: {e}")
+            data = await self._aget(url)
+        except httpx.HTTPError:
+            logger.warning(
+                "Ошибка при запросе информации о работодателе %s",
+                employer_id,
+                exc_info=True,
+            )
             return None
 
-    @staticmethod
-    def get_vacancy_details(vacancy_id: int) -> Optional[Dict[str, Any]]:
+        self._cache.put(cache_key, data)
+        return data
+
+    async def get_vacancy_details(self, vacancy_id: int) -> Optional[Dict[str, Any]]:
         """
         Получает полную информацию о вакансии.
 
+        Устарело: списочный эндпоинт /vacancies уже возвращает все поля,
+        которые читает VacancyManager.extract_vacancies (название, зарплату,
+        регион, работодателя, ссылку). Отдельный запрос на каждую вакансию —
+        это N лишних обращений к API за один прогон. Используйте метод
+        только точечно, например для полного описания уже отфильтрованных
+        вакансий.
+
         Args:
             vacancy_id (int): ID вакансии на hh.ru
 
         Returns:
             Optional[Dict[str, Any]]: Полная информация о вакансии или None в случае ошибки
         """
-        url = f"{HeadHunterAPI.BASE_URL}/vacancies/{vacancy_id}"
+        cache_key = f"vacancy:{vacancy_id}"
+        cached = self._cache.get(cache_key, VACANCY_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        url = f"{self.BASE_URL}/vacancies/{vacancy_id}"
 
         try:
-            response = requests.get(url, headers=HeadHunterAPI.HEADERS, timeout=5)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Ошибка при запросе информации о вакансии {vacancy_id}: {e}")
+            data = await self._aget(url)
+        except httpx.HTTPError:
+            logger.warning(
+                "Ошибка при запросе информации о вакансии %s",
+                vacancy_id,
+                exc_info=True,
+            )
             return None
 
-    @staticmethod
-    def get_all_vacancies_for_employer(employer_id: int) -> List[Dict[str, Any]]:
+        self._cache.put(cache_key, data)
+        return data
+
+    async def get_all_vacancies_for_employer(
+        self, employer_id: int
+    ) -> List[Dict[str, Any]]:
         """
         Получает все вакансии работодателя со всех страниц.
 
@@ -98,26 +314,27 @@ class HeadHunterAPI:
         Returns:
             List[Dict[str, Any]]: Список всех вакансий работодателя
         """
-        all_vacancies = []
-        page = 0
         per_page = 100
 
-        while True:
-            data = HeadHunterAPI.get_employer_vacancies(employer_id, page, per_page)
-
-            if data is None:
-                break
+        # Первая страница сообщает общее количество страниц
+        first = await self.get_employer_vacancies(employer_id, 0, per_page)
+        if first is None:
+            return []
 
-            vacancies = data.get("items", [])
-            all_vacancies.extend(vacancies)
+        all_vacancies = list(first.get("items", []))
+        pages = first.get("pages", 1)
 
-            # Проверяем количество страниц
-            pages = data.get("pages", 0)
-            if page >= pages - 1:
-                break
+        # Остальные страницы независимы — запрашиваем их параллельно,
+        # частоту запросов сдерживает общий семафор
+        rest = await asyncio.gather(
+            *(
+                self.get_employer_vacancies(employer_id, page, per_page)
+                for page in range(1, pages)
+            )
+        )
 
-            page += 1
-            # Уважаем API, не перегружаем сервер
-            time.sleep(0.1)
+        for data in rest:
+            if data is not None:
+                all_vacancies.extend(data.get("items", []))
 
         return all_vacancies
@@ -3,66 +3,127 @@
 Предоставляет функции для создания таблиц и управления подключением к БД.
 """
 
-import psycopg2
-from psycopg2 import Error
+import logging
+import threading
+
+import psycopg
+from psycopg import Error, errors, sql
+from psycopg.rows import tuple_row
+from psycopg_pool import ConnectionPool
 from typing import Optional
 import os
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
+# Переменные окружения загружаются один раз при импорте модуля,
+# а не при каждом создании менеджера
+load_dotenv()
+
 
 class DatabaseManager:
     """
     Класс для управления подключением к базе данных PostgreSQL.
     Обеспечивает безопасное хранение учетных данных через переменные окружения.
+    Подключения выдаются из общего пула, а не создаются на каждый запрос.
     """
 
-    def __init__(self) -> None:
-        """Инициализирует менеджер БД, загружая переменные окружения."""
-        load_dotenv()
-        self.host = os.getenv("DB_HOST", "localhost")
-        self.port = os.getenv("DB_PORT", "5432")
-        self.database = os.getenv("DB_NAME", "hh_database")
-        self.user = os.getenv("DB_USER", "postgres")
-        self.password = os.getenv("DB_PASSWORD", "")
+    # Параметры подключения читаются один раз на процесс
+    host = os.getenv("DB_HOST", "localhost")
+    # При наличии PgBouncer (pool_mode=transaction) подключаемся через него
+    port = os.getenv("DB_PGBOUNCER_PORT") or os.getenv("DB_PORT", "5432")
+    # Прямой порт PostgreSQL — для административных подключений:
+    # pgbouncer.ini проксирует только hh_database, а не системную БД
+    direct_port = os.getenv("DB_PORT", "5432")
+    database = os.getenv("DB_NAME", "hh_database")
+    user = os.getenv("DB_USER", "postgres")
+    password = os.getenv("DB_PASSWORD", "")
+
+    # Общий пул подключений (создается лениво при первом запросе);
+    # замок защищает создание от гонки параллельных первых вызовов
+    _pool: Optional[ConnectionPool] = None
+    _pool_lock = threading.Lock()
 
-    def get_connection(self) -> Optional[psycopg2.extensions.connection]:
+    @staticmethod
+    def _configure_connection(conn: psycopg.Connection) -> None:
         """
-        Получает подключение к базе данных.
+        Настраивает подключение при выдаче из пула: запросы готовятся
+        на сервере сразу при первом выполнении (аналог ручного
+        PREPARE/EXECUTE в psycopg2). Горячие INSERT не платят за
+        повторный разбор SQL в бэкенде.
+
+        Args:
+            conn (psycopg.Connection): Новое подключение пула
+        """
+        conn.prepare_threshold = 0
+        # Явно фиксируем кортежную фабрику строк: все читатели ожидают
+        # кортежи, а dict-строки стоили бы аллокацию словаря на строку
+        conn.row_factory = tuple_row
+
+    def get_connection(self) -> Optional[psycopg.Connection]:
+        """
+        Получает подключение к базе данных из общего пула.
+        После работы подключение нужно вернуть через release_connection.
 
         Returns:
-            Optional[psycopg2.extensions.connection]: Объект подключения или None
+            Optional[psycopg.Connection]: Объект подключения или None
         """
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-            )
-            return conn
+            if DatabaseManager._pool is None:
+                # Двойная проверка под замком: вставки идут из потоков
+                # (asyncio.to_thread, ThreadPoolExecutor), и два первых
+                # вызова без синхронизации создали бы по пулу каждый
+                with DatabaseManager._pool_lock:
+                    if DatabaseManager._pool is None:
+                        DatabaseManager._pool = ConnectionPool(
+                            psycopg.conninfo.make_conninfo(
+                                host=self.host,
+                                port=self.port,
+                                user=self.user,
+                                password=self.password,
+                                dbname=self.database,
+                            ),
+                            min_size=2,
+                            # Потолок около 2x числа ядер: дальше активные
+                            # бэкенды PostgreSQL только мешают друг другу
+                            max_size=2 * (os.cpu_count() or 4),
+                            configure=DatabaseManager._configure_connection,
+                        )
+            return DatabaseManager._pool.getconn()
         except Error as e:
-            print(f"Ошибка подключения к БД: {e}")
+            logger.error("Ошибка подключения к БД: %s", e)
             return None
 
-    def get_admin_connection(self) -> Optional[psycopg2.extensions.connection]:
+    def release_connection(self, conn: Optional[psycopg.Connection]) -> None:
+        """
+        Возвращает подключение обратно в пул.
+
+        Args:
+            conn (Optional[psycopg.Connection]): Подключение из пула
+        """
+        if conn is not None and DatabaseManager._pool is not None:
+            DatabaseManager._pool.putconn(conn)
+
+    def get_admin_connection(self) -> Optional[psycopg.Connection]:
         """
         Получает подключение к системной БД postgres для создания новой БД.
 
         Returns:
-            Optional[psycopg2.extensions.connection]: Объект подключения или None
+            Optional[psycopg.Connection]: Объект подключения или None
         """
         try:
-            conn = psycopg2.connect(
+            # Одноразовое подключение к системной БД идет напрямую
+            # в PostgreSQL, минуя PgBouncer
+            conn = psycopg.connect(
                 host=self.host,
-                port=self.port,
+                port=self.direct_port,
                 user=self.user,
                 password=self.password,
-                database="postgres",
+                dbname="postgres",
             )
             return conn
         except Error as e:
-            print(f"Ошибка подключения к системной БД: {e}")
+            logger.error("Ошибка подключения к системной БД: %s", e)
             return None
 
     def create_database(self) -> bool:
@@ -80,29 +141,25 @@ class DatabaseManager:
             conn.autocommit = True
             cursor = conn.cursor()
 
-            # Проверяем существование БД
-            cursor.execute(
-                "SELECT 1 FROM pg_database WHERE datname = %s", (self.database,)
-            )
-
-            if cursor.fetchone() is not None:
-                print(f"БД '{self.database}' уже существует")
-                cursor.close()
-                conn.close()
-                return True
+            # Создаем БД сразу, без проверочного SELECT:
+            # имя экранируется как идентификатор, дубликат — не ошибка
+            try:
+                cursor.execute(
+                    sql.SQL("CREATE DATABASE {}").format(sql.Identifier(self.database))
+                )
+                logger.info("БД '%s' успешно создана", self.database)
+            except errors.DuplicateDatabase:
+                logger.info("БД '%s' уже существует", self.database)
 
-            # Создаем БД
-            cursor.execute(f"CREATE DATABASE {self.database}")
-            print(f"БД '{self.database}' успешно создана")
             cursor.close()
-            conn.close()
             return True
 
         except Error as e:
-            print(f"Ошибка при создании БД: {e}")
+            logger.error("Ошибка при создании БД: %s", e)
             return False
         finally:
-            if conn is not None:
+            # Административное подключение одноразовое и не входит в пул
+            if not conn.closed:
                 conn.close()
 
     def create_tables(self) -> bool:
@@ -119,6 +176,9 @@ class DatabaseManager:
         try:
             cursor = conn.cursor()
 
+            # Каждый DDL выполняем в отдельной транзакции, чтобы не
+            # зависеть от сессии (совместимо с transaction-пулингом PgBouncer)
+
             # Создаем таблицу компаний
             cursor.execute(
                 """
@@ -131,6 +191,7 @@ class DatabaseManager:
                 )
             """
             )
+            conn.commit()
 
             # Создаем таблицу вакансий
             cursor.execute(
@@ -149,23 +210,83 @@ class DatabaseManager:
                     description TEXT,
                     url VARCHAR(500),
                     published_at TIMESTAMP,
+                    avg_salary NUMERIC GENERATED ALWAYS AS
+                        ((COALESCE(salary_from, 0) + COALESCE(salary_to, 0)) / 2.0)
+                        STORED,
                     FOREIGN KEY (company_id) REFERENCES companies(company_id)
                 )
             """
             )
+            conn.commit()
+
+            # Миграция для БД, созданных до появления avg_salary
+            cursor.execute(
+                """
+                ALTER TABLE vacancies ADD COLUMN IF NOT EXISTS
+                    avg_salary NUMERIC GENERATED ALWAYS AS
+                        ((COALESCE(salary_from, 0) + COALESCE(salary_to, 0)) / 2.0)
+                        STORED
+            """
+            )
+            conn.commit()
+
+            # Индексы под аналитические запросы DBManager:
+            # без них агрегаты и поиск превращаются в полные сканы таблицы
+            # Составной индекс отдает вакансии компании уже в порядке
+            # ORDER BY c.name, v.name и покрывает подсчеты по company_id
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vac_company_name "
+                "ON vacancies(company_id, name)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_comp_name ON companies(name)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vac_sal_from "
+                "ON vacancies(salary_from) WHERE salary_from IS NOT NULL"
+            )
+            # Сравнения и сортировка по средней зарплате идут по индексу,
+            # а не пересчитывают COALESCE-выражение на каждой строке
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vac_avg_salary "
+                "ON vacancies(avg_salary) "
+                "WHERE salary_from IS NOT NULL OR salary_to IS NOT NULL"
+            )
+            # Полнотекстовый поиск по названию и описанию вакансии
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vac_fts ON vacancies "
+                "USING gin(to_tsvector('russian', "
+                "coalesce(name, '') || ' ' || coalesce(description, '')))"
+            )
+            # Триграммные индексы ускоряют ILIKE '%слово%' —
+            # подстрочный поиск, который полнотекстовый индекс не покрывает
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vac_name_trgm "
+                "ON vacancies USING gin (name gin_trgm_ops)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_comp_name_trgm "
+                "ON companies USING gin (name gin_trgm_ops)"
+            )
+            # Btree по lower(name) для префиксных поисков
+            # (lower(name) LIKE 'слово%') без case-folding на каждой строке
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vac_name_lower "
+                "ON vacancies (lower(name) text_pattern_ops)"
+            )
 
             conn.commit()
-            print("Таблицы успешно созданы")
+            logger.info("Таблицы успешно созданы")
             cursor.close()
             return True
 
         except Error as e:
-            print(f"Ошибка при создании таблиц: {e}")
+            logger.error("Ошибка при создании таблиц: %s", e)
             conn.rollback()
             return False
         finally:
-            if conn is not None:
-                conn.close()
+            self.release_connection(conn)
 
     def clear_tables(self) -> bool:
         """
@@ -183,14 +304,13 @@ class DatabaseManager:
             cursor.execute("TRUNCATE TABLE vacancies CASCADE")
             cursor.execute("TRUNCATE TABLE companies CASCADE")
             conn.commit()
-            print("Таблицы успешно очищены")
+            logger.info("Таблицы успешно очищены")
             cursor.close()
             return True
 
         except Error as e:
-            print(f"Ошибка при очистке таблиц: {e}")
+            logger.error("Ошибка при очистке таблиц: %s", e)
             conn.rollback()
             return False
         finally:
-            if conn is not None:
-                conn.close()
+            self.release_connection(conn)
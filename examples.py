@@ -3,14 +3,15 @@
 Этот файл показывает, как использовать отдельные модули проекта.
 """
 
+import asyncio
+
 from api_manager import HeadHunterAPI
 from db_manager import DatabaseManager
 from vacancy_manager import VacancyManager, Vacancy
 from query_manager import DBManager
-import time
 
 
-def example_1_api_usage() -> None:
+async def example_1_api_usage() -> None:
     """
     Пример 1: Работа с API hh.ru
     Показывает, как получить информацию о компании и её вакансиях.
@@ -19,37 +20,36 @@ def example_1_api_usage() -> None:
     print("ПРИМЕР 1: Работа с API hh.ru")
     print("=" * 60)
 
-    api = HeadHunterAPI()
-
-    # Получаем информацию о компании Яндекс (ID: 1122242)
-    print("\n1. Получение информации о компании...")
-    company_id = 1122242
-    company_info = api.get_employer_info(company_id)
-
-    if company_info:
-        print(f"Компания: {company_info.get('name')}")
-        print(f"Сайт: {company_info.get('site_url')}")
-        print(f"Открытых вакансий: {company_info.get('open_vacancies')}")
+    async with HeadHunterAPI() as api:
+        # Получаем информацию о компании Яндекс (ID: 1122242)
+        print("\n1. Получение информации о компании...")
+        company_id = 1122242
+        company_info = await api.get_employer_info(company_id)
 
-    # Получаем вакансии компании
-    print("\n2. Получение вакансий компании...")
-    vacancies_data = api.get_employer_vacancies(company_id, page=0, per_page=10)
+        if company_info:
+            print(f"Компания: {company_info.get('name')}")
+            print(f"Сайт: {company_info.get('site_url')}")
+            print(f"Открытых вакансий: {company_info.get('open_vacancies')}")
 
-    if vacancies_data:
-        vacancies_list = vacancies_data.get("items", [])
-        print(f"Найдено вакансий на странице: {len(vacancies_list)}")
-        print(f"Всего вакансий: {vacancies_data.get('found')}")
+        # Получаем вакансии компании
+        print("\n2. Получение вакансий компании...")
+        vacancies_data = await api.get_employer_vacancies(
+            company_id, page=0, per_page=10
+        )
 
-        # Показываем первые 3 вакансии
-        for vacancy in vacancies_list[:3]:
-            print(f"\n  • {vacancy.get('name')}")
-            print(f"    ID: {vacancy.get('id')}")
-            print(f"    Работодатель: {vacancy.get('employer', {}).get('name')}")
+        if vacancies_data:
+            vacancies_list = vacancies_data.get("items", [])
+            print(f"Найдено вакансий на странице: {len(vacancies_list)}")
+            print(f"Всего вакансий: {vacancies_data.get('found')}")
 
-    time.sleep(0.5)  # Уважаем API
+            # Показываем первые 3 вакансии
+            for vacancy in vacancies_list[:3]:
+                print(f"\n  • {vacancy.get('name')}")
+                print(f"    ID: {vacancy.get('id')}")
+                print(f"    Работодатель: {vacancy.get('employer', {}).get('name')}")
 
 
-def example_2_vacancy_manager() -> None:
+async def example_2_vacancy_manager() -> None:
     """
     Пример 2: Работа с менеджером вакансий
     Показывает парсинг и фильтрацию вакансий.
@@ -58,11 +58,10 @@ def example_2_vacancy_manager() -> None:
     print("ПРИМЕР 2: Парсинг и фильтрация вакансий")
     print("=" * 60)
 
-    api = HeadHunterAPI()
-
-    # Получаем вакансии
-    print("\n1. Получение вакансий из API...")
-    vacancies_data = api.get_employer_vacancies(3529, page=0, per_page=20)
+    async with HeadHunterAPI() as api:
+        # Получаем вакансии
+        print("\n1. Получение вакансий из API...")
+        vacancies_data = await api.get_employer_vacancies(3529, page=0, per_page=20)
 
     if vacancies_data:
         # Парсим в объекты Vacancy
@@ -85,8 +84,6 @@ def example_2_vacancy_manager() -> None:
         python_vacancies = VacancyManager.filter_by_keyword(vacancies, "Python")
         print(f"Найдено вакансий: {len(python_vacancies)}")
 
-    time.sleep(0.5)
-
 
 def example_3_database_operations() -> None:
     """
@@ -185,7 +182,7 @@ def example_4_queries() -> None:
         print(f"   • {company} - {vacancy}")
 
 
-def example_5_full_workflow() -> None:
+async def example_5_full_workflow() -> None:
     """
     Пример 5: Полный рабочий процесс
     Загрузка данных одной компании и их анализ.
@@ -194,48 +191,66 @@ def example_5_full_workflow() -> None:
     print("ПРИМЕР 5: Полный рабочий процесс")
     print("=" * 60)
 
-    api = HeadHunterAPI()
     db = DatabaseManager()
     db_manager = DBManager()
 
     company_id = 3529  # 2ГИС
 
-    print("\n1. Получение информации о компании...")
-    company_info = api.get_employer_info(company_id)
+    async with HeadHunterAPI() as api:
+        print("\n1. Получение информации о компании...")
+        company_info = await api.get_employer_info(company_id)
+
+        if company_info is None:
+            return
 
-    if company_info:
         company_name = company_info.get("name")
         print(f"   Компания: {company_name}")
 
         print("\n2. Получение вакансий...")
-        all_vacancies = api.get_all_vacancies_for_employer(company_id)
+        all_vacancies = await api.get_all_vacancies_for_employer(company_id)
         print(f"   Получено {len(all_vacancies)} вакансий")
 
-        print("\n3. Парсинг вакансий...")
-        vacancies = VacancyManager.extract_vacancies(all_vacancies)
-        print(f"   Обработано {len(vacancies)} вакансий")
-
-        print("\n4. Анализ данных:")
-        vacancies_with_salary = [v for v in vacancies if v.salary_from or v.salary_to]
-        print(f"   Вакансий с информацией о зарплате: {len(vacancies_with_salary)}")
-
-        if vacancies_with_salary:
-            salaries = []
-            for v in vacancies_with_salary:
-                if v.salary_from and v.salary_to:
-                    salaries.append((v.salary_from + v.salary_to) / 2)
-                elif v.salary_from:
-                    salaries.append(v.salary_from)
-                elif v.salary_to:
-                    salaries.append(v.salary_to)
-
-            if salaries:
-                avg = sum(salaries) / len(salaries)
-                print(f"   Средняя зарплата: {avg:.2f} RUB")
-
-        print("\n5. Топ 5 вакансий по названию:")
-        for vacancy in vacancies[:5]:
-            print(f"   • {vacancy.name}")
+    print("\n3. Парсинг вакансий...")
+    vacancies = VacancyManager.extract_vacancies(all_vacancies)
+    print(f"   Обработано {len(vacancies)} вакансий")
+
+    print("\n4. Сохранение в БД...")
+    db_manager.insert_company(
+        company_id,
+        company_name,
+        company_info.get("site_url"),
+        company_info.get("open_vacancies", 0),
+    )
+    rows = [
+        (
+            v.vacancy_id,
+            v.company_id,
+            v.name,
+            v.salary_from,
+            v.salary_to,
+            v.currency,
+            v.area,
+            v.experience,
+            v.employment_type,
+            v.description,
+            v.url,
+            v.published_at,
+        )
+        for v in vacancies
+    ]
+    added = db_manager.insert_vacancies_bulk(rows)
+    print(f"   Добавлено в БД: {added} вакансий")
+
+    # Агрегаты считает PostgreSQL одним запросом, а не цикл в Python
+    print("\n5. Анализ данных:")
+    avg_salary, with_salary = db_manager.get_company_salary_stats(company_id)
+    print(f"   Вакансий с информацией о зарплате: {with_salary}")
+    if avg_salary is not None:
+        print(f"   Средняя зарплата: {avg_salary:.2f} RUB")
+
+    print("\n6. Топ 5 вакансий по названию:")
+    for vacancy in vacancies[:5]:
+        print(f"   • {vacancy.name}")
 
 
 # ============================================================================
@@ -250,11 +265,11 @@ if __name__ == "__main__":
     try:
         # Раскомментируйте нужные примеры:
 
-        # example_1_api_usage()
-        # example_2_vacancy_manager()
+        # asyncio.run(example_1_api_usage())
+        # asyncio.run(example_2_vacancy_manager())
         # example_3_database_operations()
         # example_4_queries()
-        # example_5_full_workflow()
+        # asyncio.run(example_5_full_workflow())
 
         print("\n" + "=" * 60)
         print("Раскомментируйте нужные примеры в коде для их запуска")
@@ -3,11 +3,14 @@
 Содержит основную логику и интерфейс для взаимодействия с пользователем.
 """
 
+import asyncio
+import logging
+import sys
+
 from api_manager import HeadHunterAPI
 from db_manager import DatabaseManager
 from vacancy_manager import VacancyManager
 from query_manager import DBManager
-import time
 
 
 # ID компаний для сбора данных (Топ IT и крупные компании)
@@ -25,79 +28,158 @@ COMPANIES_IDS = [
 ]
 
 
-def load_companies_and_vacancies(companies_ids: list) -> None:
+def load_companies_and_vacancies(companies_ids: list, db_manager: DBManager) -> None:
     """
     Загружает данные о компаниях и их вакансиях в БД.
 
     Args:
         companies_ids (list): Список ID компаний для загрузки
+        db_manager (DBManager): Общий менеджер БД приложения — загрузка
+            должна сбрасывать кэш именно того экземпляра, который
+            обслуживает чтения меню
     """
-    api = HeadHunterAPI()
-    db_manager = DBManager()
+    asyncio.run(_load_companies_and_vacancies(companies_ids, db_manager))
+
 
+async def _load_companies_and_vacancies(
+    companies_ids: list, db_manager: DBManager
+) -> None:
+    """
+    Асинхронно загружает данные о компаниях и их вакансиях в БД.
+
+    Args:
+        companies_ids (list): Список ID компаний для загрузки
+        db_manager (DBManager): Общий менеджер БД приложения
+    """
     print("=" * 60)
     print("ЗАГРУЗКА ДАННЫХ О КОМПАНИЯХ И ВАКАНСИЯХ")
     print("=" * 60)
 
-    for idx, company_id in enumerate(companies_ids, 1):
-        print(f"\n[{idx}/{len(companies_ids)}] Обработка компании ID: {company_id}")
+    async with HeadHunterAPI() as api:
+        await _load_companies(api, db_manager, companies_ids)
 
-        # Получаем информацию о компании
-        company_info = api.get_employer_info(company_id)
-        if company_info is None:
-            print(f"  ✗ Не удалось получить информацию о компании")
-            continue
+    print("\n" + "=" * 60)
+    print("ЗАГРУЗКА ЗАВЕРШЕНА")
+    print("=" * 60)
 
-        company_name = company_info.get("name")
-        site_url = company_info.get("site_url")
-        open_vacancies = company_info.get("open_vacancies", 0)
 
-        print(f"  ✓ Компания: {company_name}")
-        print(f"    Открытых вакансий: {open_vacancies}")
+async def _load_companies(
+    api: HeadHunterAPI, db_manager: DBManager, companies_ids: list
+) -> None:
+    """
+    Обрабатывает все компании параллельно через общий API-клиент.
+    Частоту запросов сдерживает семафор внутри HeadHunterAPI.
 
-        # Вставляем информацию о компании в БД
-        if db_manager.insert_company(
-            company_id, company_name, site_url, open_vacancies
-        ):
-            print(f"  ✓ Компания добавлена в БД")
+    Args:
+        api (HeadHunterAPI): Открытый API-клиент
+        db_manager (DBManager): Менеджер БД для вставки данных
+        companies_ids (list): Список ID компаний для загрузки
+    """
+    print_lock = asyncio.Lock()
+    await asyncio.gather(
+        *(
+            _process_company(api, db_manager, company_id, print_lock)
+            for company_id in companies_ids
+        )
+    )
+
+
+async def _process_company(
+    api: HeadHunterAPI,
+    db_manager: DBManager,
+    company_id: int,
+    print_lock: asyncio.Lock,
+) -> None:
+    """
+    Загружает одну компанию и её вакансии в БД.
+
+    Args:
+        api (HeadHunterAPI): Открытый API-клиент
+        db_manager (DBManager): Менеджер БД для вставки данных
+        company_id (int): ID компании на hh.ru
+        print_lock (asyncio.Lock): Блокировка, чтобы вывод компаний
+            не перемешивался между задачами
+    """
+    # Получаем информацию о компании
+    company_info = await api.get_employer_info(company_id)
+    if company_info is None:
+        async with print_lock:
+            print(f"\n✗ Компания ID {company_id}: не удалось получить информацию")
+        return
+
+    company_name = company_info.get("name")
+    site_url = company_info.get("site_url")
+    open_vacancies = company_info.get("open_vacancies", 0)
+
+    # Получаем все вакансии компании
+    vacancies_data = await api.get_all_vacancies_for_employer(company_id)
+    # Кортежи для COPY строятся сразу из ответа API,
+    # без промежуточных объектов Vacancy
+    rows = VacancyManager.extract_rows(vacancies_data)
+
+    # Блокирующие обращения к БД уводим в поток, чтобы не
+    # останавливать цикл событий; подключения выдает общий пул
+    company_added = await asyncio.to_thread(
+        db_manager.insert_company, company_id, company_name, site_url, open_vacancies
+    )
+    added_count = 0
+    if company_added:
+        added_count = await asyncio.to_thread(db_manager.bulk_load_vacancies, rows)
+
+    async with print_lock:
+        print(f"\nКомпания: {company_name} (ID: {company_id})")
+        print(f"  Открытых вакансий: {open_vacancies}")
+        if company_added:
+            print(f"  ✓ Получено вакансий: {len(vacancies_data)}")
+            print(f"  ✓ Добавлено в БД: {added_count} вакансий")
         else:
             print(f"  ✗ Ошибка при добавлении компании в БД")
-            continue
-
-        # Получаем все вакансии компании
-        print(f"  → Загрузка вакансий...")
-        vacancies_data = api.get_all_vacancies_for_employer(company_id)
-        print(f"  ✓ Получено вакансий: {len(vacancies_data)}")
-
-        # Обрабатываем и добавляем вакансии в БД
-        vacancies = VacancyManager.extract_vacancies(vacancies_data)
-        added_count = 0
-
-        for vacancy in vacancies:
-            if db_manager.insert_vacancy(
-                vacancy.vacancy_id,
-                vacancy.company_id,
-                vacancy.name,
-                vacancy.salary_from,
-                vacancy.salary_to,
-                vacancy.currency,
-                vacancy.area,
-                vacancy.experience,
-                vacancy.employment_type,
-                vacancy.description,
-                vacancy.url,
-                vacancy.published_at,
-            ):
-                added_count += 1
-
-        print(f"  ✓ Добавлено в БД: {added_count} вакансий")
-
-        # Соблюдаем ограничения API
-        time.sleep(0.5)
 
-    print("\n" + "=" * 60)
-    print("ЗАГРУЗКА ЗАВЕРШЕНА")
-    print("=" * 60)
+
+# Сколько строк накапливаем перед записью в stdout
+DISPLAY_BATCH = 100
+
+
+def _format_salary(salary_from, salary_to, currency) -> str:
+    """
+    Форматирует зарплатную вилку для вывода.
+
+    Args:
+        salary_from: Минимальная зарплата или None
+        salary_to: Максимальная зарплата или None
+        currency: Валюта или None
+
+    Returns:
+        str: Строка вида "100000 - 150000 RUB" или "не указана"
+    """
+    if salary_from and salary_to:
+        return f"{salary_from} - {salary_to} {currency}"
+    if salary_from:
+        return f"от {salary_from} {currency}"
+    if salary_to:
+        return f"до {salary_to} {currency}"
+    return "не указана"
+
+
+def _format_vacancy_block(row: tuple) -> str:
+    """
+    Форматирует одну вакансию в текстовый блок.
+
+    Args:
+        row (tuple): Кортеж (компания, вакансия, зарплата от, зарплата до,
+            валюта, ссылка)
+
+    Returns:
+        str: Готовый к выводу блок текста
+    """
+    company_name, vacancy_name, salary_from, salary_to, currency, url = row
+    salary_str = _format_salary(salary_from, salary_to, currency)
+    return (
+        f"Компания: {company_name}\n"
+        f"Вакансия: {vacancy_name}\n"
+        f"Зарплата: {salary_str}\n"
+        f"Ссылка: {url}\n" + "-" * 60 + "\n"
+    )
 
 
 def display_companies_and_vacancies(db_manager: DBManager) -> None:
@@ -132,26 +214,24 @@ def display_all_vacancies(db_manager: DBManager) -> None:
     print("ВСЕ ВАКАНСИИ")
     print("=" * 60)
 
-    results = db_manager.get_all_vacancies()
+    count = 0
+    blocks = []
 
-    if not results:
-        print("Нет данных")
-        return
+    # Вакансии стримятся из БД порциями; stdout пишем пачками,
+    # а не по пять print на строку
+    for row in db_manager.get_all_vacancies():
+        blocks.append("\n" + _format_vacancy_block(row))
+        count += 1
+        if len(blocks) >= DISPLAY_BATCH:
+            sys.stdout.write("".join(blocks))
+            blocks.clear()
 
-    for company_name, vacancy_name, salary_from, salary_to, currency, url in results:
-        salary_str = "не указана"
-        if salary_from and salary_to:
-            salary_str = f"{salary_from} - {salary_to} {currency}"
-        elif salary_from:
-            salary_str = f"от {salary_from} {currency}"
-        elif salary_to:
-            salary_str = f"до {salary_to} {currency}"
+    if blocks:
+        sys.stdout.write("".join(blocks))
+    sys.stdout.flush()
 
-        print(f"\nКомпания: {company_name}")
-        print(f"Вакансия: {vacancy_name}")
-        print(f"Зарплата: {salary_str}")
-        print(f"Ссылка: {url}")
-        print("-" * 60)
+    if count == 0:
+        print("Нет данных")
 
 
 def display_average_salary(db_manager: DBManager) -> None:
@@ -192,20 +272,8 @@ def display_vacancies_with_higher_salary(db_manager: DBManager) -> None:
 
     print(f"Найдено вакансий: {len(results)}\n")
 
-    for company_name, vacancy_name, salary_from, salary_to, currency, url in results:
-        salary_str = "не указана"
-        if salary_from and salary_to:
-            salary_str = f"{salary_from} - {salary_to} {currency}"
-        elif salary_from:
-            salary_str = f"от {salary_from} {currency}"
-        elif salary_to:
-            salary_str = f"до {salary_to} {currency}"
-
-        print(f"Компания: {company_name}")
-        print(f"Вакансия: {vacancy_name}")
-        print(f"Зарплата: {salary_str}")
-        print(f"Ссылка: {url}")
-        print("-" * 60)
+    sys.stdout.write("".join(_format_vacancy_block(row) for row in results))
+    sys.stdout.flush()
 
 
 def display_vacancies_by_keyword(db_manager: DBManager, keyword: str) -> None:
@@ -228,20 +296,8 @@ def display_vacancies_by_keyword(db_manager: DBManager, keyword: str) -> None:
 
     print(f"Найдено вакансий: {len(results)}\n")
 
-    for company_name, vacancy_name, salary_from, salary_to, currency, url in results:
-        salary_str = "не указана"
-        if salary_from and salary_to:
-            salary_str = f"{salary_from} - {salary_to} {currency}"
-        elif salary_from:
-            salary_str = f"от {salary_from} {currency}"
-        elif salary_to:
-            salary_str = f"до {salary_to} {currency}"
-
-        print(f"Компания: {company_name}")
-        print(f"Вакансия: {vacancy_name}")
-        print(f"Зарплата: {salary_str}")
-        print(f"Ссылка: {url}")
-        print("-" * 60)
+    sys.stdout.write("".join(_format_vacancy_block(row) for row in results))
+    sys.stdout.flush()
 
 
 def show_menu() -> None:
@@ -261,6 +317,12 @@ def show_menu() -> None:
 
 def main() -> None:
     """Главная функция приложения."""
+    # Единый обработчик логов вместо print в каждом модуле
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
     print("\n╔════════════════════════════════════════════════════════════╗")
     print("║        ПАРСЕР ВАКАНСИЙ С HH.RU                            ║")
     print("║        Сбор и анализ данных о вакансиях и компаниях       ║")
@@ -294,7 +356,7 @@ def main() -> None:
         choice = input("Выберите опцию: ").strip()
 
         if choice == "1":
-            load_companies_and_vacancies(COMPANIES_IDS)
+            load_companies_and_vacancies(COMPANIES_IDS, db_manager)
 
         elif choice == "2":
             display_companies_and_vacancies(db_manager)
@@ -3,21 +3,292 @@
 Предоставляет методы для выполнения различных запросов к БД.
 """
 
-import psycopg2
-from psycopg2 import Error
-from typing import List, Tuple, Optional
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, Optional
+
+from psycopg import Error
 from db_manager import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
+# Время жизни кэша результатов запросов в секундах:
+# между загрузками данные в БД не меняются
+QUERY_CACHE_TTL = 30
+
 
 class DBManager:
     """
     Класс для работы с данными в базе данных PostgreSQL.
-    Использует библиотеку psycopg2 для взаимодействия с БД.
+    Использует библиотеку psycopg (v3) для взаимодействия с БД.
+    Результаты читающих запросов кэшируются на короткий срок
+    и сбрасываются при любой записи.
+    """
+
+    # SQL-шаблоны горячих вставок: используются и одиночными методами,
+    # и пакетной загрузкой внутри одной транзакции
+    _INSERT_COMPANY_SQL = """
+        INSERT INTO companies (company_id, name, site_url, open_vacancies)
+        VALUES (%s, %s, %s, %s)
+        ON CONFLICT (company_id) DO UPDATE
+        SET name = EXCLUDED.name,
+            site_url = EXCLUDED.site_url,
+            open_vacancies = EXCLUDED.open_vacancies
+    """
+    _INSERT_VACANCY_SQL = """
+        INSERT INTO vacancies
+        (vacancy_id, company_id, name, salary_from, salary_to, currency,
+         area, experience, employment_type, description, url, published_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (vacancy_id) DO NOTHING
     """
 
     def __init__(self) -> None:
         """Инициализирует DBManager с менеджером БД."""
         self.db = DatabaseManager()
+        self._cache: dict = {}
+
+    @contextmanager
+    def ingest_transaction(self, synchronous_commit: bool = True):
+        """
+        Контекстный менеджер пакетной загрузки: одно подключение,
+        один курсор и один commit на весь блок вместо commit (и fsync WAL)
+        на каждую запись.
+
+        Args:
+            synchronous_commit (bool): False отключает ожидание fsync WAL
+                для этой транзакции — допустимо, если потеря последнего
+                пакета при сбое не критична
+
+        Yields:
+            Курсор открытой транзакции для _insert_company_row /
+            _insert_vacancy_row
+
+        Raises:
+            Error: При сбое транзакции (после отката) — вызывающий код
+                должен узнать, что пакет не записан
+        """
+        conn = self.db.get_connection()
+        if conn is None:
+            raise Error("Не удалось получить подключение к БД")
+
+        cursor = None
+        try:
+            cursor = conn.cursor()
+            if not synchronous_commit:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+
+            yield cursor
+
+            conn.commit()
+            self.clear_cache()
+
+        except Error as e:
+            logger.error("Ошибка в транзакции загрузки: %s", e)
+            # Пакет не записан — молча завершить with-блок нельзя
+            raise
+        finally:
+            # Любое исключение из тела with-блока (не только psycopg.Error)
+            # оставляет транзакцию открытой: откатываем перед возвратом
+            # в пул; после commit откат — пустая операция
+            if cursor is not None and not cursor.closed:
+                cursor.close()
+            if not conn.closed:
+                conn.rollback()
+            self.db.release_connection(conn)
+
+    @classmethod
+    def _insert_company_row(
+        cls,
+        cursor,
+        company_id: int,
+        name: str,
+        site_url: Optional[str],
+        open_vacancies: int,
+    ) -> None:
+        """
+        Вставляет/обновляет компанию через внешний курсор;
+        транзакцией управляет вызывающий код.
+        """
+        cursor.execute(
+            cls._INSERT_COMPANY_SQL, (company_id, name, site_url, open_vacancies)
+        )
+
+    @classmethod
+    def _insert_vacancy_row(cls, cursor, row: Tuple) -> None:
+        """
+        Вставляет вакансию через внешний курсор;
+        транзакцией управляет вызывающий код.
+        """
+        cursor.execute(cls._INSERT_VACANCY_SQL, row)
+
+    def _cached(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Возвращает результат запроса из кэша или вычисляет и кэширует его.
+
+        Args:
+            key (tuple): Ключ кэша (имя метода и аргументы)
+            compute (Callable[[], Any]): Функция, выполняющая запрос
+
+        Returns:
+            Any: Результат запроса
+        """
+        entry = self._cache.get(key)
+        now = time.time()
+        if entry is not None and now - entry[0] < QUERY_CACHE_TTL:
+            return entry[1]
+
+        value = compute()
+        self._cache[key] = (now, value)
+        return value
+
+    def clear_cache(self) -> None:
+        """Сбрасывает кэш результатов запросов (вызывается после записи)."""
+        self._cache.clear()
+
+    def _run(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        fetch: str = "all",
+        default: Any = None,
+        error_msg: str = "Ошибка при выполнении запроса",
+    ) -> Any:
+        """
+        Выполняет читающий запрос: подключение из пула, курсор,
+        выборка, возврат подключения. Один помощник вместо одинакового
+        try/except/finally в каждом читающем методе.
+
+        Args:
+            query (str): SQL-запрос
+            params (Optional[tuple]): Параметры запроса
+            fetch (str): "all" — fetchall, "one" — fetchone
+            default (Any): Что вернуть при недоступной БД или ошибке
+            error_msg (str): Префикс сообщения об ошибке
+
+        Returns:
+            Any: Результат выборки или default
+        """
+        conn = self.db.get_connection()
+        if conn is None:
+            return default
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            result = cursor.fetchone() if fetch == "one" else cursor.fetchall()
+            cursor.close()
+            return result
+
+        except Error as e:
+            logger.error("%s: %s", error_msg, e)
+            return default
+        finally:
+            # Читающая транзакция закрывается явно: иначе пул откатывает
+            # возвращенное подключение сам и пишет warning на каждый запрос
+            if not conn.closed:
+                conn.rollback()
+            self.db.release_connection(conn)
+
+    def get_companies_and_vacancies_count(self) -> List[Tuple]:
+        """
+        Получает список всех компаний и количество вакансий у каждой компании.
+        Результат кэшируется на QUERY_CACHE_TTL секунд.
+
+        Returns:
+            List[Tuple]: Список кортежей (название компании, количество вакансий)
+        """
+        return self._cached(
+            ("companies_and_vacancies_count",),
+            self._get_companies_and_vacancies_count,
+        )
+
+    def get_avg_salary(self) -> Optional[float]:
+        """
+        Получает среднюю зарплату по всем вакансиям.
+        Результат кэшируется на QUERY_CACHE_TTL секунд и сбрасывается
+        при любой успешной записи: повторные обращения между загрузками
+        не сканируют таблицу заново.
+
+        Returns:
+            Optional[float]: Средняя зарплата или None при ошибке
+        """
+        return self._cached(("avg_salary",), self._get_avg_salary)
+
+    def get_company_salary_stats(self, company_id: int) -> Tuple[Optional[float], int]:
+        """
+        Считает зарплатную статистику компании.
+        Результат кэшируется на QUERY_CACHE_TTL секунд.
+
+        Args:
+            company_id (int): ID компании на hh.ru
+
+        Returns:
+            Tuple[Optional[float], int]: Средняя зарплата (или None)
+            и количество вакансий с указанной зарплатой
+        """
+        return self._cached(
+            ("company_salary_stats", company_id),
+            lambda: self._get_company_salary_stats(company_id),
+        )
+
+    def get_vacancies_with_higher_salary(self) -> List[Tuple]:
+        """
+        Получает список всех вакансий, у которых зарплата выше средней.
+        Результат кэшируется на QUERY_CACHE_TTL секунд.
+
+        Returns:
+            List[Tuple]: Список вакансий с высокой зарплатой
+        """
+        return self._cached(
+            ("vacancies_with_higher_salary",),
+            self._get_vacancies_with_higher_salary,
+        )
+
+    def get_vacancies_with_keyword(self, keyword: str) -> List[Tuple]:
+        """
+        Получает список всех вакансий по ключевому слову.
+        Результат кэшируется на QUERY_CACHE_TTL секунд.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+
+        Returns:
+            List[Tuple]: Список найденных вакансий
+        """
+        return self._cached(
+            ("vacancies_with_keyword", keyword),
+            lambda: self._get_vacancies_with_keyword(keyword),
+        )
+
+    def find_vacancies(
+        self,
+        keyword: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+    ) -> List[Tuple]:
+        """
+        Ищет вакансии по ключевому слову и/или диапазону средней зарплаты.
+        Фильтрация выполняется на стороне БД по существующим индексам —
+        для данных, уже загруженных в PostgreSQL, это быстрее, чем
+        фильтры VacancyManager в Python. Результат кэшируется
+        на QUERY_CACHE_TTL секунд.
+
+        Args:
+            keyword (Optional[str]): Слово для поиска в названии вакансии
+            salary_min (Optional[int]): Нижняя граница средней зарплаты
+            salary_max (Optional[int]): Верхняя граница средней зарплаты
+
+        Returns:
+            List[Tuple]: Список найденных вакансий
+        """
+        return self._cached(
+            ("find_vacancies", keyword, salary_min, salary_max),
+            lambda: self._find_vacancies(keyword, salary_min, salary_max),
+        )
 
     def insert_company(
         self, company_id: int, name: str, site_url: Optional[str], open_vacancies: int
@@ -40,29 +311,19 @@ class DBManager:
 
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO companies (company_id, name, site_url, open_vacancies)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (company_id) DO UPDATE
-                SET name = EXCLUDED.name,
-                    site_url = EXCLUDED.site_url,
-                    open_vacancies = EXCLUDED.open_vacancies
-            """,
-                (company_id, name, site_url, open_vacancies),
-            )
+            self._insert_company_row(cursor, company_id, name, site_url, open_vacancies)
 
             conn.commit()
             cursor.close()
+            self.clear_cache()
             return True
 
         except Error as e:
-            print(f"Ошибка при вставке компании: {e}")
+            logger.error("Ошибка при вставке компании: %s", e)
             conn.rollback()
             return False
         finally:
-            if conn is not None:
-                conn.close()
+            self.db.release_connection(conn)
 
     def insert_vacancy(
         self,
@@ -81,6 +342,9 @@ class DBManager:
     ) -> bool:
         """
         Вставляет информацию о вакансии в таблицу.
+        Повторная вставка существующей вакансии не считается ошибкой:
+        конфликт по vacancy_id пропускается на стороне сервера,
+        транзакция остается живой.
 
         Args:
             vacancy_id (int): ID вакансии на hh.ru
@@ -105,14 +369,8 @@ class DBManager:
 
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO vacancies
-                (vacancy_id, company_id, name, salary_from, salary_to, currency,
-                 area, experience, employment_type, description, url, published_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (vacancy_id) DO NOTHING
-            """,
+            self._insert_vacancy_row(
+                cursor,
                 (
                     vacancy_id,
                     company_id,
@@ -131,181 +389,283 @@ class DBManager:
 
             conn.commit()
             cursor.close()
+            self.clear_cache()
             return True
 
         except Error as e:
-            print(f"Ошибка при вставке вакансии: {e}")
+            logger.error("Ошибка при вставке вакансии: %s", e)
             conn.rollback()
             return False
         finally:
-            if conn is not None:
-                conn.close()
+            self.db.release_connection(conn)
 
-    def get_companies_and_vacancies_count(self) -> List[Tuple]:
+    def upsert_vacancy_with_company(
+        self, company_row: Tuple, vacancy_row: Tuple
+    ) -> bool:
         """
-        Получает список всех компаний и количество вакансий у каждой компании.
+        Вставляет компанию и её вакансию одним SQL-запросом:
+        upsert компании идет в writeable CTE, вакансия — в основном
+        INSERT того же оператора. Один execute и один commit вместо
+        двух транзакций и двух сетевых обращений на запись.
+
+        Args:
+            company_row (Tuple): Кортеж
+                (company_id, name, site_url, open_vacancies)
+            vacancy_row (Tuple): Кортеж значений в порядке колонок таблицы
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
 
         Returns:
-            List[Tuple]: Список кортежей (название компании, количество вакансий)
+            bool: True при успешной записи, False при ошибке
         """
         conn = self.db.get_connection()
         if conn is None:
-            return []
+            return False
 
         try:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT c.name, COUNT(v.id) as vacancy_count
-                FROM companies c
-                LEFT JOIN vacancies v ON c.company_id = v.company_id
-                GROUP BY c.id, c.name
-                ORDER BY vacancy_count DESC
-            """
+                WITH c AS (
+                    INSERT INTO companies (company_id, name, site_url, open_vacancies)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (company_id) DO UPDATE
+                    SET name = EXCLUDED.name,
+                        site_url = EXCLUDED.site_url,
+                        open_vacancies = EXCLUDED.open_vacancies
+                )
+                INSERT INTO vacancies
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (vacancy_id) DO NOTHING
+            """,
+                (*company_row, *vacancy_row),
             )
 
-            results = cursor.fetchall()
+            conn.commit()
             cursor.close()
-            return results
+            self.clear_cache()
+            return True
 
         except Error as e:
-            print(f"Ошибка при получении компаний и вакансий: {e}")
-            return []
+            logger.error("Ошибка при совместной вставке компании и вакансии: %s", e)
+            conn.rollback()
+            return False
         finally:
-            if conn is not None:
-                conn.close()
+            self.db.release_connection(conn)
 
-    def get_all_vacancies(self) -> List[Tuple]:
+    def insert_companies_bulk(self, rows: List[Tuple]) -> int:
         """
-        Получает список всех вакансий с названием компании, названием вакансии, зарплатой и ссылкой.
+        Вставляет пакет компаний одной сетевой пачкой (pipeline-режим).
+        Существующие компании обновляются по company_id.
+
+        Args:
+            rows (List[Tuple]): Кортежи значений в порядке колонок таблицы
+                (company_id, name, site_url, open_vacancies)
 
         Returns:
-            List[Tuple]: Список кортежей (компания, вакансия, зарплата, ссылка)
+            int: Количество затронутых строк
         """
+        if not rows:
+            return 0
+
         conn = self.db.get_connection()
         if conn is None:
-            return []
+            return 0
 
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT c.name as company_name,
-                       v.name as vacancy_name,
-                       v.salary_from,
-                       v.salary_to,
-                       v.currency,
-                       v.url
-                FROM vacancies v
-                JOIN companies c ON v.company_id = c.company_id
-                ORDER BY c.name, v.name
-            """
-            )
+            with conn.pipeline():
+                cursor.executemany(self._INSERT_COMPANY_SQL, rows)
 
-            results = cursor.fetchall()
+            affected = cursor.rowcount
+            conn.commit()
             cursor.close()
-            return results
+            self.clear_cache()
+            return affected
 
         except Error as e:
-            print(f"Ошибка при получении вакансий: {e}")
-            return []
+            logger.error("Ошибка при пакетной вставке компаний: %s", e)
+            conn.rollback()
+            return 0
         finally:
-            if conn is not None:
-                conn.close()
+            self.db.release_connection(conn)
 
-    def get_avg_salary(self) -> Optional[float]:
+    def insert_vacancies_bulk(self, rows: List[Tuple]) -> int:
         """
-        Получает среднюю зарплату по всем вакансиям.
+        Вставляет пакет вакансий в pipeline-режиме libpq:
+        все INSERT отправляются одной сетевой пачкой без ожидания
+        подтверждения каждого. Дубликаты (по vacancy_id) пропускаются
+        на стороне сервера.
+
+        Args:
+            rows (List[Tuple]): Кортежи значений в порядке колонок таблицы
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
 
         Returns:
-            Optional[float]: Средняя зарплата или None при ошибке
+            int: Количество добавленных строк
         """
+        if not rows:
+            return 0
+
         conn = self.db.get_connection()
         if conn is None:
-            return None
+            return 0
 
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT AVG((COALESCE(salary_from, 0) + COALESCE(salary_to, 0)) / 2) as avg_salary
-                FROM vacancies
-                WHERE salary_from IS NOT NULL OR salary_to IS NOT NULL
-            """
-            )
+            with conn.pipeline():
+                cursor.executemany(self._INSERT_VACANCY_SQL, rows)
 
-            result = cursor.fetchone()
+            inserted = cursor.rowcount
+            conn.commit()
             cursor.close()
-
-            return result[0] if result and result[0] is not None else None
+            self.clear_cache()
+            return inserted
 
         except Error as e:
-            print(f"Ошибка при получении средней зарплаты: {e}")
-            return None
+            logger.error("Ошибка при пакетной вставке вакансий: %s", e)
+            conn.rollback()
+            return 0
         finally:
-            if conn is not None:
-                conn.close()
+            self.db.release_connection(conn)
 
-    def get_vacancies_with_higher_salary(self) -> List[Tuple]:
+    def insert_vacancies_parallel(self, rows: List[Tuple]) -> int:
         """
-        Получает список всех вакансий, у которых зарплата выше средней.
+        Распределяет большой пакет вакансий по нескольким потокам:
+        каждый поток грузит свой кусок через insert_vacancies_bulk
+        на собственном подключении из пула. libpq отпускает GIL
+        во время сетевого ввода-вывода, поэтому привязка параметров
+        следующей пачки идет параллельно с fsync WAL предыдущей.
+
+        Args:
+            rows (List[Tuple]): Кортежи значений в порядке колонок таблицы
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
 
         Returns:
-            List[Tuple]: Список вакансий с высокой зарплатой
+            int: Количество добавленных строк
+        """
+        if not rows:
+            return 0
+
+        # Оставляем один коннект пула читателям; больше 2x ядер
+        # писатели PostgreSQL уже не ускоряют
+        workers = max(1, 2 * (os.cpu_count() or 4) - 1)
+
+        # Маленький пакет не окупает накладные расходы потоков
+        if len(rows) <= workers:
+            return self.insert_vacancies_bulk(rows)
+
+        chunk_size = -(-len(rows) // workers)
+        chunks = [rows[i: i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return sum(pool.map(self.insert_vacancies_bulk, chunks))
+
+    def bulk_load_vacancies(self, rows: Iterable[Tuple]) -> int:
+        """
+        Грузит вакансии через протокол COPY — самый быстрый путь
+        массовой загрузки в PostgreSQL. Строки пишутся во временную
+        staging-таблицу, затем переносятся одним INSERT ... SELECT
+        с сохранением upsert-семантики (дубликаты пропускаются).
+
+        Args:
+            rows (Iterable[Tuple]): Кортежи значений в порядке колонок таблицы
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
+
+        Returns:
+            int: Количество добавленных строк
         """
         conn = self.db.get_connection()
         if conn is None:
-            return []
+            return 0
 
         try:
             cursor = conn.cursor()
             cursor.execute(
+                "CREATE TEMP TABLE vacancies_stage "
+                "(LIKE vacancies INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+
+            with cursor.copy(
                 """
-                SELECT c.name as company_name,
-                       v.name as vacancy_name,
-                       v.salary_from,
-                       v.salary_to,
-                       v.currency,
-                       v.url
-                FROM vacancies v
-                JOIN companies c ON v.company_id = c.company_id
-                WHERE (COALESCE(v.salary_from, 0) + COALESCE(v.salary_to, 0)) / 2 > (
-                    SELECT AVG((COALESCE(salary_from, 0) + COALESCE(salary_to, 0)) / 2)
-                    FROM vacancies
-                    WHERE salary_from IS NOT NULL OR salary_to IS NOT NULL
-                )
-                AND (v.salary_from IS NOT NULL OR v.salary_to IS NOT NULL)
-                ORDER BY (COALESCE(v.salary_from, 0) + COALESCE(v.salary_to, 0)) / 2 DESC
+                COPY vacancies_stage
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
+                FROM STDIN
+            """
+            ) as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+            cursor.execute(
+                """
+                INSERT INTO vacancies
+                (vacancy_id, company_id, name, salary_from, salary_to, currency,
+                 area, experience, employment_type, description, url, published_at)
+                SELECT vacancy_id, company_id, name, salary_from, salary_to, currency,
+                       area, experience, employment_type, description, url, published_at
+                FROM vacancies_stage
+                ON CONFLICT (vacancy_id) DO NOTHING
             """
             )
 
-            results = cursor.fetchall()
+            inserted = cursor.rowcount
+            conn.commit()
             cursor.close()
-            return results
+            self.clear_cache()
+            return inserted
 
         except Error as e:
-            print(f"Ошибка при получении вакансий с высокой зарплатой: {e}")
-            return []
+            logger.error("Ошибка при загрузке вакансий через COPY: %s", e)
+            conn.rollback()
+            return 0
         finally:
-            if conn is not None:
-                conn.close()
+            self.db.release_connection(conn)
 
-    def get_vacancies_with_keyword(self, keyword: str) -> List[Tuple]:
+    def _get_companies_and_vacancies_count(self) -> List[Tuple]:
         """
-        Получает список всех вакансий, в названии которых содержится переданное слово.
-
-        Args:
-            keyword (str): Ключевое слово для поиска
+        Получает список всех компаний и количество вакансий у каждой компании.
 
         Returns:
-            List[Tuple]: Список найденных вакансий
+            List[Tuple]: Список кортежей (название компании, количество вакансий)
+        """
+        return self._run(
+            """
+            SELECT c.name, COUNT(v.id) as vacancy_count
+            FROM companies c
+            LEFT JOIN vacancies v ON c.company_id = v.company_id
+            GROUP BY c.id, c.name
+            ORDER BY vacancy_count DESC
+            """,
+            default=[],
+            error_msg="Ошибка при получении компаний и вакансий",
+        )
+
+    def get_all_vacancies(self) -> Iterator[Tuple]:
+        """
+        Отдает все вакансии с названием компании, названием вакансии,
+        зарплатой и ссылкой. Результат стримится через серверный курсор
+        порциями по 2000 строк, не материализуя всю выборку в памяти.
+
+        Yields:
+            Tuple: Кортеж (компания, вакансия, зарплата от, зарплата до,
+            валюта, ссылка)
         """
         conn = self.db.get_connection()
         if conn is None:
-            return []
+            return
 
         try:
-            cursor = conn.cursor()
+            # Именованный курсор — серверный: строки приходят пачками
+            cursor = conn.cursor(name="vac_stream")
+            # Пик памяти остается O(itersize); 2000 строк на fetch —
+            # достаточно редкие сетевые обращения при скромном буфере
+            cursor.itersize = 2000
             cursor.execute(
                 """
                 SELECT c.name as company_name,
@@ -316,19 +676,190 @@ class DBManager:
                        v.url
                 FROM vacancies v
                 JOIN companies c ON v.company_id = c.company_id
-                WHERE v.name ILIKE %s
                 ORDER BY c.name, v.name
-            """,
-                (f"%{keyword}%",),
+            """
             )
 
-            results = cursor.fetchall()
+            for row in cursor:
+                yield row
+
             cursor.close()
-            return results
 
         except Error as e:
-            print(f"Ошибка при поиске вакансий по ключевому слову: {e}")
-            return []
+            logger.error("Ошибка при получении вакансий: %s", e)
         finally:
-            if conn is not None:
-                conn.close()
+            # Закрываем транзакцию серверного курсора и при обычном
+            # завершении, и при брошенном генераторе — пул не должен
+            # получать подключение в состоянии INTRANS
+            if not conn.closed:
+                conn.rollback()
+            self.db.release_connection(conn)
+
+    def _get_avg_salary(self) -> Optional[float]:
+        """
+        Получает среднюю зарплату по всем вакансиям.
+
+        Returns:
+            Optional[float]: Средняя зарплата или None при ошибке
+        """
+        result = self._run(
+            """
+            SELECT AVG(avg_salary) as avg_salary
+            FROM vacancies
+            WHERE salary_from IS NOT NULL OR salary_to IS NOT NULL
+            """,
+            fetch="one",
+            error_msg="Ошибка при получении средней зарплаты",
+        )
+        return result[0] if result and result[0] is not None else None
+
+    def _get_company_salary_stats(self, company_id: int) -> Tuple[Optional[float], int]:
+        """
+        Считает зарплатную статистику компании одним SQL-запросом.
+
+        Args:
+            company_id (int): ID компании на hh.ru
+
+        Returns:
+            Tuple[Optional[float], int]: Средняя зарплата (или None)
+            и количество вакансий с указанной зарплатой
+        """
+        result = self._run(
+            """
+            SELECT AVG(COALESCE((salary_from + salary_to) / 2.0,
+                                salary_from, salary_to)) AS avg_salary,
+                   COUNT(*) FILTER (WHERE salary_from IS NOT NULL
+                                    OR salary_to IS NOT NULL) AS with_salary
+            FROM vacancies
+            WHERE company_id = %s
+            """,
+            (company_id,),
+            fetch="one",
+            error_msg="Ошибка при расчете статистики по компании",
+        )
+
+        if result is None:
+            return (None, 0)
+
+        avg_salary = float(result[0]) if result[0] is not None else None
+        return (avg_salary, result[1])
+
+    def _get_vacancies_with_higher_salary(self) -> List[Tuple]:
+        """
+        Получает список всех вакансий, у которых зарплата выше средней.
+
+        Returns:
+            List[Tuple]: Список вакансий с высокой зарплатой
+        """
+        return self._run(
+            """
+            WITH avg_s AS (
+                SELECT AVG(avg_salary) AS a
+                FROM vacancies
+                WHERE salary_from IS NOT NULL OR salary_to IS NOT NULL
+            )
+            SELECT c.name as company_name,
+                   v.name as vacancy_name,
+                   v.salary_from,
+                   v.salary_to,
+                   v.currency,
+                   v.url
+            FROM vacancies v
+            JOIN companies c ON v.company_id = c.company_id,
+                 avg_s
+            WHERE v.avg_salary > avg_s.a
+            AND (v.salary_from IS NOT NULL OR v.salary_to IS NOT NULL)
+            ORDER BY v.avg_salary DESC
+            """,
+            default=[],
+            error_msg="Ошибка при получении вакансий с высокой зарплатой",
+        )
+
+    def _get_vacancies_with_keyword(self, keyword: str) -> List[Tuple]:
+        """
+        Получает список всех вакансий, в названии или описании которых
+        содержится переданное слово. Сочетает полнотекстовый поиск
+        с подстрочным ILIKE по названию; оба условия идут по GIN-индексам.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+
+        Returns:
+            List[Tuple]: Список найденных вакансий
+        """
+        return self._run(
+            """
+            SELECT c.name as company_name,
+                   v.name as vacancy_name,
+                   v.salary_from,
+                   v.salary_to,
+                   v.currency,
+                   v.url
+            FROM vacancies v
+            JOIN companies c ON v.company_id = c.company_id
+            WHERE to_tsvector('russian',
+                      coalesce(v.name, '') || ' ' || coalesce(v.description, ''))
+                  @@ plainto_tsquery('russian', %s)
+               OR v.name ILIKE %s
+            ORDER BY c.name, v.name
+            """,
+            (keyword, f"%{keyword}%"),
+            default=[],
+            error_msg="Ошибка при поиске вакансий по ключевому слову",
+        )
+
+    def _find_vacancies(
+        self,
+        keyword: Optional[str],
+        salary_min: Optional[int],
+        salary_max: Optional[int],
+    ) -> List[Tuple]:
+        """
+        Собирает параметризованный запрос из переданных условий.
+        Поиск по слову идет через триграммный GIN-индекс (ILIKE),
+        зарплатные границы — по индексу на avg_salary.
+
+        Args:
+            keyword (Optional[str]): Слово для поиска в названии вакансии
+            salary_min (Optional[int]): Нижняя граница средней зарплаты
+            salary_max (Optional[int]): Верхняя граница средней зарплаты
+
+        Returns:
+            List[Tuple]: Список найденных вакансий
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if keyword:
+            conditions.append("v.name ILIKE %s")
+            params.append(f"%{keyword}%")
+        if salary_min is not None or salary_max is not None:
+            conditions.append(
+                "(v.salary_from IS NOT NULL OR v.salary_to IS NOT NULL)"
+            )
+        if salary_min is not None:
+            conditions.append("v.avg_salary >= %s")
+            params.append(salary_min)
+        if salary_max is not None:
+            conditions.append("v.avg_salary <= %s")
+            params.append(salary_max)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        return self._run(
+            f"""
+            SELECT c.name as company_name,
+                   v.name as vacancy_name,
+                   v.salary_from,
+                   v.salary_to,
+                   v.currency,
+                   v.url
+            FROM vacancies v
+            JOIN companies c ON v.company_id = c.company_id
+            {where}
+            ORDER BY c.name, v.name
+            """,
+            tuple(params),
+            default=[],
+            error_msg="Ошибка при поиске вакансий",
+        )
@@ -3,7 +3,14 @@
 Предоставляет класс для работы с данными о вакансиях.
 """
 
-from typing import Optional, List, Dict, Any
+import logging
+from typing import Optional, List, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Общий пустой словарь для отсутствующих вложенных объектов API:
+# не выделяем новый dict на каждую запись в горячем цикле разбора
+_EMPTY: Dict[str, Any] = {}
 
 
 class Vacancy:
@@ -12,6 +19,24 @@ class Vacancy:
     Содержит информацию о вакансии и методы для ее обработки.
     """
 
+    # Фиксированный набор атрибутов вместо __dict__: экземпляр занимает
+    # заметно меньше памяти, а чтение атрибута — слот на уровне C
+    __slots__ = (
+        "vacancy_id",
+        "company_id",
+        "name",
+        "salary_from",
+        "salary_to",
+        "currency",
+        "area",
+        "experience",
+        "employment_type",
+        "description",
+        "url",
+        "published_at",
+        "_name_lower",
+    )
+
     def __init__(
         self,
         vacancy_id: int,
@@ -47,6 +72,9 @@ class Vacancy:
         self.vacancy_id = vacancy_id
         self.company_id = company_id
         self.name = name
+        # Название в нижнем регистре считается один раз при создании:
+        # повторные поиски не перекладывают case-folding на каждую строку
+        self._name_lower = name.lower() if name else ""
         self.salary_from = salary_from
         self.salary_to = salary_to
         self.currency = currency
@@ -67,41 +95,34 @@ class Vacancy:
 
         Returns:
             Vacancy: Объект вакансии
+
+        Raises:
+            KeyError: Если в данных нет обязательных полей (id, работодатель)
+            ValueError: Если ID не приводится к числу
         """
-        vacancy_id = vacancy_data.get("id")
-        company_id = vacancy_data.get("employer", {}).get("id")
-        name = vacancy_data.get("name")
-
-        salary = vacancy_data.get("salary")
-        salary_from = None
-        salary_to = None
-        currency = None
-
-        if salary is not None:
-            salary_from = salary.get("from")
-            salary_to = salary.get("to")
-            currency = salary.get("currency")
-
-        area = vacancy_data.get("area", {}).get("name")
-        experience = vacancy_data.get("experience", {}).get("name")
-        employment_type = vacancy_data.get("employment", {}).get("name")
-        description = vacancy_data.get("description", "")
-        url = vacancy_data.get("alternate_url")
-        published_at = vacancy_data.get("published_at")
+        # Связанный метод get создается один раз, а не на каждое поле.
+        # API отдает null для отсутствующих вложенных объектов, поэтому
+        # `or _EMPTY` вместо default-аргумента get: один общий словарь
+        # вместо нового `{}` на каждое обращение
+        get = vacancy_data.get
+        salary = get("salary") or _EMPTY
 
+        # Обязательные поля читаем напрямую: у корректной записи API
+        # они есть всегда, а редкую битую запись отсеет try/except
+        # вызывающего кода — ветвлений в горячем пути нет
         return Vacancy(
-            vacancy_id=int(vacancy_id),
-            company_id=int(company_id),
-            name=name,
-            salary_from=salary_from,
-            salary_to=salary_to,
-            currency=currency,
-            area=area,
-            experience=experience,
-            employment_type=employment_type,
-            description=description,
-            url=url,
-            published_at=published_at,
+            vacancy_id=int(vacancy_data["id"]),
+            company_id=int(vacancy_data["employer"]["id"]),
+            name=vacancy_data["name"],
+            salary_from=salary.get("from"),
+            salary_to=salary.get("to"),
+            currency=salary.get("currency"),
+            area=(get("area") or _EMPTY).get("name"),
+            experience=(get("experience") or _EMPTY).get("name"),
+            employment_type=(get("employment") or _EMPTY).get("name"),
+            description=get("description", ""),
+            url=get("alternate_url"),
+            published_at=get("published_at"),
         )
 
     def __repr__(self) -> str:
@@ -126,22 +147,83 @@ class VacancyManager:
         Returns:
             List[Vacancy]: Список объектов вакансий
         """
-        vacancies = []
+        vacancies: List[Vacancy] = []
+        # Локальные ссылки на горячие атрибуты: без поиска имени
+        # в классе/списке на каждой итерации
+        append = vacancies.append
+        parse = Vacancy.parse_from_api
         for vacancy_data in vacancies_data:
             try:
-                vacancy = Vacancy.parse_from_api(vacancy_data)
-                vacancies.append(vacancy)
+                append(parse(vacancy_data))
             except (KeyError, ValueError, TypeError) as e:
-                print(f"Ошибка при обработке вакансии: {e}")
-                continue
+                # Ленивое %-форматирование: строка собирается, только
+                # если уровень WARNING действительно пишется
+                logger.warning("Ошибка при обработке вакансии: %s", e)
 
         return vacancies
 
+    @staticmethod
+    def extract_rows(
+        vacancies_data: List[Dict[str, Any]],
+    ) -> List[Tuple]:
+        """
+        Преобразует данные API сразу в кортежи для пакетной вставки в БД.
+
+        Промежуточные объекты Vacancy не создаются: когда следующий шаг —
+        COPY/executemany, достаточно кортежей в порядке столбцов таблицы
+        vacancies. Записи без обязательных полей (id, работодатель,
+        название) пропускаются.
+
+        Args:
+            vacancies_data (List[Dict[str, Any]]): Список данных вакансий из API
+
+        Returns:
+            List[Tuple]: Кортежи в порядке столбцов таблицы vacancies
+        """
+        rows: List[Tuple] = []
+        append = rows.append
+        for vacancy_data in vacancies_data:
+            get = vacancy_data.get
+            vacancy_id = get("id")
+            company_id = (get("employer") or _EMPTY).get("id")
+            name = get("name")
+            if not (vacancy_id and company_id and name):
+                continue
+            salary = get("salary") or _EMPTY
+            try:
+                append(
+                    (
+                        int(vacancy_id),
+                        int(company_id),
+                        name,
+                        salary.get("from"),
+                        salary.get("to"),
+                        salary.get("currency"),
+                        (get("area") or _EMPTY).get("name"),
+                        (get("experience") or _EMPTY).get("name"),
+                        (get("employment") or _EMPTY).get("name"),
+                        get("description", ""),
+                        get("alternate_url"),
+                        get("published_at"),
+                    )
+                )
+            except (ValueError, TypeError) as e:
+                # Битая запись (нечисловой ID и т.п.) не должна ронять
+                # весь прогон загрузки — пропускаем её, как extract_vacancies
+                logger.warning("Ошибка при обработке вакансии: %s", e)
+
+        return rows
+
     @staticmethod
     def filter_by_keyword(vacancies: List[Vacancy], keyword: str) -> List[Vacancy]:
         """
         Фильтрует вакансии по ключевому слову в названии.
 
+        Применяется только к данным, еще не загруженным в БД
+        (например, к свежему ответу API). Для вакансий, уже лежащих
+        в PostgreSQL, используйте DBManager.find_vacancies — фильтрация
+        по индексу на стороне БД быстрее перебора в Python.
+
         Args:
             vacancies (List[Vacancy]): Список вакансий
             keyword (str): Ключевое слово для поиска
@@ -150,7 +232,7 @@ class VacancyManager:
             List[Vacancy]: Отфильтрованный список вакансий
         """
         keyword_lower = keyword.lower()
-        return [v for v in vacancies if keyword_lower in v.name.lower()]
+        return [v for v in vacancies if keyword_lower in v._name_lower]
 
     @staticmethod
     def filter_by_salary_range(
@@ -161,6 +243,10 @@ class VacancyManager:
         """
         Фильтрует вакансии по диапазону зарплаты.
 
+        Применяется только к данным, еще не загруженным в БД.
+        Для вакансий из PostgreSQL используйте DBManager.find_vacancies
+        с параметрами salary_min/salary_max.
+
         Args:
             vacancies (List[Vacancy]): Список вакансий
             salary_from (Optional[int]): Минимальная зарплата